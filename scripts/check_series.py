@@ -1,28 +1,36 @@
 #!/usr/bin/env python3
-import json
 import os
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 enriched_dir = 'json/enriched'
 total_movies = 0
 total_series = 0
+apple_tv_series = None
+apple_tv_total = 0
 
-for file in os.listdir(enriched_dir):
-    if file.endswith('.json'):
-        with open(os.path.join(enriched_dir, file)) as f:
-            data = json.load(f)
-            for item in data:
-                if item and item.get('type') == 'series':
-                    total_series += 1
-                else:
-                    total_movies += 1
+with os.scandir(enriched_dir) as entries:
+    for entry in entries:
+        if not entry.name.endswith('.json'):
+            continue
+        with open(entry.path, 'rb') as f:
+            data = loads(f.read())
+        series_count = sum(1 for item in data if item and item.get('type') == 'series')
+        total_series += series_count
+        total_movies += len(data) - series_count
+        # Apple TV (aproveita o parse do loop em vez de reabrir o arquivo)
+        if entry.name == 'apple-tv.json':
+            apple_tv_series = [item for item in data if item and item.get('type') == 'series']
+            apple_tv_total = len(data)
 
 print(f'Total filmes: {total_movies}')
 print(f'Total series: {total_series}')
 
 # Apple TV
-with open('json/enriched/apple-tv.json') as f:
-    data = json.load(f)
-    series = [item for item in data if item and item.get('type') == 'series']
-    print(f'\nApple TV+ series: {len(series)} de {len(data)}')
-    if series:
-        print(f'  Exemplo: {series[0].get("name")}')
+if apple_tv_series is not None:
+    print(f'\nApple TV+ series: {len(apple_tv_series)} de {apple_tv_total}')
+    if apple_tv_series:
+        print(f'  Exemplo: {apple_tv_series[0].get("name")}')
@@ -8,12 +8,20 @@ Como usar:
     python3 scripts/convert_m3u8_to_json.py
 """
 
+import functools
 import json
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from zlib import crc32
 from datetime import datetime
-from typing import Optional, Dict, List, Any, Tuple
+from typing import Optional, Dict, List, Any, Set, Tuple, Union
+
+try:
+    import orjson  # Encoder em Rust, bem mais rápido que o json da stdlib
+except ImportError:
+    orjson = None
 
 # Categorias que devem ser ignoradas (TV ao vivo, esportes, etc.)
 IGNORED_CATEGORIES = [
@@ -28,77 +36,99 @@ IGNORED_CATEGORIES = [
     'Área do cliente', 'JOGOS DE HOJE', 'RÁDIOS FM', 'CANAIS:',
 ]
 
+# Versões em maiúsculas pré-calculadas para should_ignore_category
+IGNORED_CATEGORIES_UPPER = frozenset(ignored.upper() for ignored in IGNORED_CATEGORIES)
+IGNORED_PREFIXES_UPPER = tuple(IGNORED_CATEGORIES_UPPER)
+
 # Keywords adulto
 ADULT_KEYWORDS = ['ADULTOS', '[HOT]', 'XXX', '[Adulto]', 'ADULTO', '❌❤️']
+ADULT_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in ADULT_KEYWORDS))
 
 # Keywords de série na categoria
 SERIES_CATEGORY_KEYWORDS = ['series', 'série', 'novelas', 'doramas', 'programas', 'stand up', '24h']
 
-# Patterns de episódio
-EPISODE_PATTERNS = [
-    re.compile(r'S\d+\s*E\d+', re.IGNORECASE),
-    re.compile(r'T\d+\s*E\d+', re.IGNORECASE),
-    re.compile(r'\d+\s*x\s*\d+', re.IGNORECASE),
-    re.compile(r'Temporada\s*\d+', re.IGNORECASE),
-    re.compile(r'Temp\.?\s*\d+', re.IGNORECASE),
-    re.compile(r'Season\s*\d+', re.IGNORECASE),
-]
+# Pattern de episódio (alternativas unidas: uma única busca por nome)
+EPISODE_PATTERN = re.compile(
+    r'S\d+\s*E\d+|T\d+\s*E\d+|\d+\s*x\s*\d+|Temporada\s*\d+|Temp\.?\s*\d+|Season\s*\d+',
+    re.IGNORECASE,
+)
+
+# Pattern de info de série: cada formato fica num lookahead ancorado no início,
+# então o primeiro formato que casar vence (SxxEyy > TxxEyy > NxM), como antes
+SERIES_INFO_PATTERN = re.compile(
+    r'(?=(.+?)\s*S(\d+)\s*E(\d+))'
+    r'|(?=(.+?)\s*T(\d+)\s*E(\d+))'
+    r'|(?=(.+?)\s*(\d+)\s*x\s*(\d+))',
+    re.IGNORECASE,
+)
+
+# Patterns do parser (compilados uma vez, usados a cada linha #EXTINF)
+GROUP_TITLE_PATTERN = re.compile(r'group-title="([^"]*)"')
+TVG_LOGO_PATTERN = re.compile(r'tvg-logo="([^"]*)"')
 
-# Patterns de info de série
-SERIES_INFO_PATTERNS = [
-    re.compile(r'^(.+?)\s*S(\d+)\s*E(\d+)', re.IGNORECASE),
-    re.compile(r'^(.+?)\s*T(\d+)\s*E(\d+)', re.IGNORECASE),
-    re.compile(r'^(.+?)\s*(\d+)\s*x\s*(\d+)', re.IGNORECASE),
+# Patterns de limpeza de nome
+CLEAN_NAME_PATTERNS = [
+    re.compile(r'^\d+\s*[-–]\s*'),
+    re.compile(r'\s*\[L\]\s*$', re.IGNORECASE),
+    re.compile(r'\s*\(DUB\)\s*', re.IGNORECASE),
+    re.compile(r'\s*\(LEG\)\s*', re.IGNORECASE),
 ]
 
+# Ano em categorias de lançamentos
+YEAR_PATTERN = re.compile(r'20\d{2}')
 
+# Patterns de geração de ID
+ID_INVALID_CHARS_PATTERN = re.compile(r'[^a-z0-9\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+# Funções que dependem só da categoria usam lru_cache: uma playlist tem milhões de
+# itens mas poucas centenas de group-titles distintos
+@functools.lru_cache(maxsize=4096)
 def should_ignore_category(category: str) -> bool:
     upper = category.upper()
-    for ignored in IGNORED_CATEGORIES:
-        upper_ignored = ignored.upper()
-        if upper.startswith(upper_ignored) or upper == upper_ignored or category == ignored:
-            return True
-    return False
+    return upper in IGNORED_CATEGORIES_UPPER or upper.startswith(IGNORED_PREFIXES_UPPER)
 
 
+@functools.lru_cache(maxsize=4096)
 def is_series_by_category(category: str) -> bool:
     lower = category.lower()
     return any(keyword in lower for keyword in SERIES_CATEGORY_KEYWORDS)
 
 
 def is_series_by_name(name: str) -> bool:
-    return any(pattern.search(name) for pattern in EPISODE_PATTERNS)
+    return EPISODE_PATTERN.search(name) is not None
 
 
 def is_adult_content(name: str, category: str) -> bool:
-    combined = f'{name} {category}'
-    return any(keyword in combined for keyword in ADULT_KEYWORDS)
+    # Nenhuma keyword tem espaço, então buscar em cada campo equivale a buscar em 'nome categoria'
+    return ADULT_PATTERN.search(name) is not None or ADULT_PATTERN.search(category) is not None
 
 
 def parse_series_info(name: str) -> Optional[Tuple[str, int, int]]:
-    for pattern in SERIES_INFO_PATTERNS:
-        match = pattern.match(name)
-        if match:
-            return (match.group(1).strip(), int(match.group(2)), int(match.group(3)))
-    return None
+    match = SERIES_INFO_PATTERN.match(name)
+    if not match:
+        return None
+    # Grupos 1-3, 4-6 ou 7-9, conforme o formato que casou
+    start = match.lastindex - 2
+    return (match.group(start).strip(), int(match.group(start + 1)), int(match.group(start + 2)))
 
 
 def clean_name(name: str) -> str:
-    name = re.sub(r'^\d+\s*[-–]\s*', '', name)
-    name = re.sub(r'\s*\[L\]\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s*\(DUB\)\s*', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s*\(LEG\)\s*', '', name, flags=re.IGNORECASE)
+    for pattern in CLEAN_NAME_PATTERNS:
+        name = pattern.sub('', name)
     return name.strip()
 
 
 def generate_id(name: str, url: str) -> str:
-    normalized = re.sub(r'[^a-z0-9\s]', '', name.lower()).strip()
-    normalized = re.sub(r'\s+', '-', normalized)
-    url_hash = str(abs(hash(url)))
-    hash_part = url_hash[:6] if len(url_hash) > 6 else url_hash
+    normalized = ID_INVALID_CHARS_PATTERN.sub('', name.lower()).strip()
+    normalized = WHITESPACE_PATTERN.sub('-', normalized)
+    # crc32 é estável entre execuções (hash() do Python é salteado por processo)
+    hash_part = f'{crc32(url.encode()):08x}'[:6]
     return f'{normalized}-{hash_part}'
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_category(category: str) -> str:
     # Remove prefixos comuns
     if category.startswith('OND /'):
@@ -230,8 +260,7 @@ def normalize_category(category: str) -> str:
         return 'Outras Produtoras'
     if 'lançamento' in lower or 'lancamento' in lower:
         # Extrai o ano se presente
-        import re
-        year_match = re.search(r'20\d{2}', category)
+        year_match = YEAR_PATTERN.search(category)
         if year_match:
             return f'Lançamentos {year_match.group()}'
         return 'Lançamentos'
@@ -275,95 +304,135 @@ def normalize_category(category: str) -> str:
     return category
 
 
+@functools.lru_cache(maxsize=4096)
 def category_to_filename(category: str) -> str:
     filename = re.sub(r'[^a-z0-9]+', '_', category.lower())
     filename = re.sub(r'^_+|_+$', '', filename)
     return filename
 
 
-def parse_m3u8_file(filepath: Path) -> List[Dict[str, Any]]:
-    """Parse um arquivo M3U8 e retorna lista de filmes/séries."""
-    items = []
-    
-    print(f'📖 Lendo: {filepath}')
+def dump_json(data: Any, path: Union[str, Path], pretty: bool = False) -> None:
+    """Salva JSON em UTF-8 (compacto ou indentado), usando orjson se disponível."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        if pretty:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def parse_m3u8_file(
+    filepath: Path,
+    by_category: Dict[str, List[Dict[str, Any]]],
+    seen_urls: Set[str],
+) -> Tuple[int, int]:
+    """Parse um arquivo M3U8, agrupando filmes/séries em by_category.
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    URLs já presentes em seen_urls (compartilhado entre arquivos) são descartadas.
+    Retorna (itens adicionados, duplicatas).
+    """
+    added = 0
+    duplicates = 0
     
-    lines = content.split('\n')
+    print(f'📖 Lendo: {filepath}')
     
     current_name = None
     current_category = None
     current_logo = None
     
-    for line in lines:
-        line = line.strip()
-        
-        if line.startswith('#EXTINF:'):
-            # Extrai group-title
-            group_match = re.search(r'group-title="([^"]*)"', line)
-            current_category = group_match.group(1) if group_match else 'Outros'
+    # Lê linha a linha para não manter o arquivo inteiro + a lista de linhas em memória
+    with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        for line in f:
+            # Só #EXTINF e URLs interessam: descarta as demais linhas pelo primeiro
+            # caractere, sem alocar uma string nova com strip()
+            first = line[:1]
+            if first == '#':
+                if not line.startswith('#EXTINF:'):
+                    continue
+            elif first != 'h':
+                # Linha vazia, indentada ou de outro tipo: caminho lento
+                line = line.strip()
+                if not line.startswith(('#EXTINF:', 'http')):
+                    continue
+            line = line.strip()
             
-            # Extrai logo
-            logo_match = re.search(r'tvg-logo="([^"]*)"', line)
-            current_logo = logo_match.group(1) if logo_match else None
-            
-            # Extrai nome (após a última vírgula)
-            name_match = re.search(r',(.+)$', line)
-            current_name = name_match.group(1).strip() if name_match else None
-            
-        elif line.startswith('http') and current_name:
-            url = line
-            
-            # Ignora .ts (streams ao vivo)
-            if url.lower().endswith('.ts'):
-                current_name = None
-                current_category = None
-                current_logo = None
-                continue
-            
-            category = current_category or 'Outros'
-            
-            # Ignora categorias bloqueadas
-            if should_ignore_category(category):
+            if line.startswith('#EXTINF:'):
+                # Extrai group-title
+                group_match = GROUP_TITLE_PATTERN.search(line)
+                current_category = group_match.group(1) if group_match else 'Outros'
+                
+                # Extrai logo
+                logo_match = TVG_LOGO_PATTERN.search(line)
+                current_logo = logo_match.group(1) if logo_match else None
+                
+                # Extrai nome (após a primeira vírgula, nomes podem conter vírgulas)
+                _, sep, name_part = line.partition(',')
+                current_name = name_part.strip() if sep else None
+                
+            elif line.startswith('http') and current_name:
+                url = line
+                
+                # Ignora .ts (streams ao vivo)
+                if url.lower().endswith('.ts'):
+                    current_name = None
+                    current_category = None
+                    current_logo = None
+                    continue
+                
+                category = current_category or 'Outros'
+                
+                # Ignora categorias bloqueadas
+                if should_ignore_category(category):
+                    current_name = None
+                    current_category = None
+                    current_logo = None
+                    continue
+                
+                # Ignora duplicatas por URL
+                if url in seen_urls:
+                    duplicates += 1
+                    current_name = None
+                    current_category = None
+                    current_logo = None
+                    continue
+                seen_urls.add(url)
+                
+                cleaned_name = clean_name(current_name)
+                is_adult = is_adult_content(current_name, category)
+                is_series = is_series_by_category(category) or is_series_by_name(current_name)
+                series_info = parse_series_info(current_name)
+                content_type = 'series' if (is_series or series_info) else 'movie'
+                normalized_category = normalize_category(category)
+                
+                item = {
+                    'id': generate_id(cleaned_name, url),
+                    'name': cleaned_name,
+                    'url': url,
+                    'type': content_type,
+                }
+                
+                if current_logo:
+                    item['logo'] = current_logo
+                
+                if is_adult:
+                    item['isAdult'] = True
+                
+                if series_info:
+                    item['seriesName'] = series_info[0]
+                    item['season'] = series_info[1]
+                    item['episode'] = series_info[2]
+                
+                by_category.setdefault(normalized_category, []).append(item)
+                added += 1
+                
                 current_name = None
                 current_category = None
                 current_logo = None
-                continue
-            
-            cleaned_name = clean_name(current_name)
-            is_adult = is_adult_content(current_name, category)
-            is_series = is_series_by_category(category) or is_series_by_name(current_name)
-            series_info = parse_series_info(current_name)
-            content_type = 'series' if (is_series or series_info) else 'movie'
-            normalized_category = normalize_category(category)
-            
-            item = {
-                'id': generate_id(cleaned_name, url),
-                'name': cleaned_name,
-                'url': url,
-                'type': content_type,
-            }
-            
-            if current_logo:
-                item['logo'] = current_logo
-            
-            if is_adult:
-                item['isAdult'] = True
-            
-            if series_info:
-                item['seriesName'] = series_info[0]
-                item['season'] = series_info[1]
-                item['episode'] = series_info[2]
-            
-            item['_category'] = normalized_category
-            items.append(item)
-            
-            current_name = None
-            current_category = None
-            current_logo = None
     
-    return items
+    return added, duplicates
 
 
 def main():
@@ -389,50 +458,44 @@ def main():
         assets_dir / 'ListaBR02.m3u8',
     ]
     
-    # Parse todos os arquivos
-    all_items = []
+    # Parse todos os arquivos (removendo duplicatas por URL durante o parse)
+    # e agrupando por categoria
+    by_category: Dict[str, List[Dict[str, Any]]] = {}
+    seen_urls: Set[str] = set()
+    parsed_count = 0
+    duplicates = 0
     for filepath in m3u8_files:
         if filepath.exists():
-            items = parse_m3u8_file(filepath)
-            all_items.extend(items)
+            added, file_duplicates = parse_m3u8_file(filepath, by_category, seen_urls)
+            parsed_count += added
+            duplicates += file_duplicates
         else:
             print(f'⚠️ Arquivo não encontrado: {filepath}')
     
-    # Remove duplicatas por URL
-    seen_urls = set()
-    unique_items = []
-    duplicates = 0
-    
-    for item in all_items:
-        if item['url'] not in seen_urls:
-            seen_urls.add(item['url'])
-            unique_items.append(item)
-        else:
-            duplicates += 1
-    
     print(f'\n📊 Estatísticas de parsing:')
-    print(f'   ✅ Itens válidos: {len(unique_items)}')
+    print(f'   ✅ Itens válidos: {parsed_count}')
     print(f'   🔄 Duplicatas removidas: {duplicates}\n')
     
-    # Agrupa por categoria
-    by_category: Dict[str, List[Dict]] = {}
-    for item in unique_items:
-        category = item.pop('_category')
-        by_category.setdefault(category, []).append(item)
-    
     print(f'   📁 Categorias: {len(by_category)}\n')
     
     # Gera arquivos por categoria (dividindo categorias grandes)
+    # As escritas são enfileiradas e feitas em paralelo no final
     category_index = []
+    pending_writes: List[Tuple[Any, Union[str, Path], bool]] = []
     total_saved = 0
     
     for category, items in by_category.items():
         filename_base = category_to_filename(category)
         
-        # Separa por tipo
-        movies = [m for m in items if m['type'] == 'movie' and not m.get('isAdult')]
-        series = [m for m in items if m['type'] == 'series' and not m.get('isAdult')]
-        adult = [m for m in items if m.get('isAdult')]
+        # Separa por tipo (uma única passada)
+        movies, series, adult = [], [], []
+        for m in items:
+            if m.get('isAdult'):
+                adult.append(m)
+            elif m['type'] == 'series':
+                series.append(m)
+            else:
+                movies.append(m)
         
         total_items = len(movies) + len(series) + len(adult)
         total_saved += total_items
@@ -448,34 +511,29 @@ def main():
             movies_pages = [movies[i:i+MAX_ITEMS_PER_FILE] for i in range(0, len(movies), MAX_ITEMS_PER_FILE)]
             
             # Cria arquivos paginados
+            # As páginas não repetem o nome da categoria: ele já está no index.json
+            base_path = f'{output_dir}/{filename_base}'
+            total_pages = max(len(series_pages), len(movies_pages))
             page_idx = 1
             for page_series in series_pages:
-                filename = f'{filename_base}_p{page_idx}'
                 category_data = {
-                    'category': category,
                     'page': page_idx,
-                    'totalPages': max(len(series_pages), len(movies_pages)),
+                    'totalPages': total_pages,
                     'movies': [],
                     'series': page_series,
                 }
-                category_file = output_dir / f'{filename}.json'
-                with open(category_file, 'w', encoding='utf-8') as f:
-                    json.dump(category_data, f, ensure_ascii=False, separators=(',', ':'))
-                print(f'      📄 {filename}.json: {len(page_series)} séries')
+                pending_writes.append((category_data, f'{base_path}_p{page_idx}.json', False))
+                print(f'      📄 {filename_base}_p{page_idx}.json: {len(page_series)} séries')
                 page_idx += 1
             
             # Adiciona filmes restantes (geralmente poucos)
             if movies:
-                filename = f'{filename_base}_movies'
                 category_data = {
-                    'category': category,
                     'movies': movies,
                     'series': [],
                 }
-                category_file = output_dir / f'{filename}.json'
-                with open(category_file, 'w', encoding='utf-8') as f:
-                    json.dump(category_data, f, ensure_ascii=False, separators=(',', ':'))
-                print(f'      📄 {filename}.json: {len(movies)} filmes')
+                pending_writes.append((category_data, f'{base_path}_movies.json', False))
+                print(f'      📄 {filename_base}_movies.json: {len(movies)} filmes')
             
             # Adiciona ao índice com info de paginação
             category_index.append({
@@ -507,8 +565,7 @@ def main():
             }
             
             category_file = output_dir / f'{filename_base}.json'
-            with open(category_file, 'w', encoding='utf-8') as f:
-                json.dump(category_data, f, ensure_ascii=False, separators=(',', ':'))
+            pending_writes.append((category_data, category_file, False))
             
             print(f'   📄 {filename_base}.json: {len(movies)} filmes, {len(series)} séries')
         
@@ -519,8 +576,7 @@ def main():
                 'items': adult,
             }
             adult_file = output_dir / f'{filename_base}_adult.json'
-            with open(adult_file, 'w', encoding='utf-8') as f:
-                json.dump(adult_data, f, ensure_ascii=False, separators=(',', ':'))
+            pending_writes.append((adult_data, adult_file, False))
             print(f'   🔞 {filename_base}_adult.json: {len(adult)} itens')
     
     # Ordena índice por quantidade
@@ -538,8 +594,11 @@ def main():
     }
     
     index_file = output_dir / 'index.json'
-    with open(index_file, 'w', encoding='utf-8') as f:
-        json.dump(index_data, f, ensure_ascii=False, indent=2)
+    pending_writes.append((index_data, index_file, True))
+    
+    # Arquivos são independentes: codifica/grava em paralelo
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+        list(executor.map(lambda write: dump_json(*write), pending_writes))
     
     elapsed = time.time() - start_time
     
@@ -1,4 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
+import io
 import os
 
 base_path = "/Users/gabrielespindola/Documents/saimo_tv_app/android/app/src/main/res"
@@ -10,46 +12,90 @@ sizes = {
     "mipmap-xxxhdpi": 192,
 }
 
-def create_icon(size):
-    img = Image.new('RGBA', (size, size), (229, 9, 20, 255))
-    draw = ImageDraw.Draw(img)
-    font_size = int(size * 0.6)
+# Tamanho de referência em que o "S" é rasterizado (uma única vez)
+GLYPH_BASE = 1024
+
+def render_glyph(text="S"):
+    # Máscara recortada na tinta; a fonte só é carregada aqui, no processo principal.
+    # Retorna também o tamanho de fonte realmente usado (None para a fonte bitmap padrão)
     try:
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
+        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", GLYPH_BASE)
     except:
-        font = ImageFont.load_default()
-    text = "S"
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (size - text_width) / 2
-    y = (size - text_height) / 2 - bbox[1]
-    draw.text((x, y), text, fill='white', font=font)
+        try:
+            font = ImageFont.load_default(GLYPH_BASE)  # Pillow >= 10.1
+        except TypeError:
+            font = ImageFont.load_default()
+    bbox = font.getbbox(text)
+    glyph = Image.new('L', (bbox[2] - bbox[0], bbox[3] - bbox[1]), 0)
+    ImageDraw.Draw(glyph).text((-bbox[0], -bbox[1]), text, fill=255, font=font)
+    return glyph, getattr(font, "size", None)
+
+def place(canvas, glyph, font_size):
+    # Redimensiona o glifo para a escala de font_size e cola em branco, centralizado.
+    # Fonte bitmap (sem tamanho) é colada no tamanho nativo, como o draw.text fazia
+    glyph, glyph_size = glyph
+    scale = font_size / glyph_size if glyph_size else 1
+    width = max(1, round(glyph.width * scale))
+    height = max(1, round(glyph.height * scale))
+    scaled = glyph.resize((width, height), Image.LANCZOS)
+    box = ((canvas.width - width) // 2, (canvas.height - height) // 2)
+    canvas.paste((255, 255, 255, 255), box, scaled)
+
+def create_icon(size, glyph):
+    img = Image.new('RGBA', (size, size), (229, 9, 20, 255))
+    place(img, glyph, int(size * 0.6))
     return img
 
-for folder, size in sizes.items():
-    path = os.path.join(base_path, folder)
-    os.makedirs(path, exist_ok=True)
-    icon = create_icon(size)
-    icon.save(os.path.join(path, "ic_launcher.png"), "PNG")
-    print(f"Criado: {folder}/ic_launcher.png")
-    
+def create_foreground(size, glyph):
     fg_size = int(size * 108 / 48)
     fg = Image.new('RGBA', (fg_size, fg_size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(fg)
     inner_size = int(size * 72 / 48)
-    font_size = int(inner_size * 0.6)
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-    except:
-        font = ImageFont.load_default()
-    bbox = draw.textbbox((0, 0), "S", font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (fg_size - text_width) / 2
-    y = (fg_size - text_height) / 2 - bbox[1]
-    draw.text((x, y), "S", fill='white', font=font)
-    fg.save(os.path.join(path, "ic_launcher_foreground.png"), "PNG")
-    print(f"Criado: {folder}/ic_launcher_foreground.png")
-
-print("Todos os icones criados!")
+    place(fg, glyph, int(inner_size * 0.6))
+    return fg
+
+def to_png_bytes(img):
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+# (construtor, nível zlib): o launcher mantém compressão padrão (vai no APK);
+# o foreground, quase todo transparente, usa o nível mais rápido
+builders = {
+    "ic_launcher": (create_icon, 6),
+    "ic_launcher_foreground": (create_foreground, 1),
+}
+
+def render_one(job):
+    # Recebe o glifo em PNG (bytes): imagens PIL não devem ser enviadas via pickle
+    path, size, kind, glyph, glyph_size = job
+    create, compress_level = builders[kind]
+    img = create(size, (Image.open(io.BytesIO(glyph)), glyph_size))
+    # Poucas cores (vermelho, branco e as bordas suavizadas): paleta reduz bem o PNG
+    img = img.quantize(colors=64, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.FLOYDSTEINBERG)
+    buf = io.BytesIO()
+    img.save(buf, "PNG", compress_level=compress_level, optimize=False)
+    return path, buf.getvalue()
+
+if __name__ == "__main__":
+    # O "S" é rasterizado uma vez e apenas redimensionado para cada densidade
+    glyph, glyph_size = render_glyph()
+    glyph = to_png_bytes(glyph)
+
+    # Caminhos e diretórios resolvidos uma vez, antes de despachar os jobs
+    targets = [(os.path.join(base_path, folder), size) for folder, size in sizes.items()]
+    for path, _ in targets:
+        os.makedirs(path, exist_ok=True)
+    jobs = [
+        (os.path.join(path, f"{kind}.png"), size, kind, glyph, glyph_size)
+        for path, size in targets
+        for kind in builders
+    ]
+
+    # Renderização e codificação PNG são CPU pura e independentes entre arquivos
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for path, data in ex.map(render_one, jobs):
+            with open(path, "wb") as f:
+                f.write(data)
+            print(f"Criado: {os.path.relpath(path, base_path)}")
+
+    print("Todos os icones criados!")
@@ -1,37 +1,79 @@
 #!/usr/bin/env python3
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import json
+import mmap
 import os
 
-enriched_dir = 'json/enriched'
-total = 0
-items_with_cast = 0
-actor_counts = {}
-
-for file in os.listdir(enriched_dir):
-    if file.endswith('.json'):
-        with open(os.path.join(enriched_dir, file)) as f:
-            data = json.load(f)
-            for item in data:
-                if item is None:
-                    continue
-                total += 1
-                tmdb = item.get('tmdb', {})
-                if tmdb:
-                    cast = tmdb.get('cast', [])
-                    if cast:
-                        items_with_cast += 1
-                        for actor in cast:
-                            aid = actor.get('id', 0)
-                            aname = actor.get('name', '')
-                            if aid not in actor_counts:
-                                actor_counts[aid] = {'name': aname, 'count': 0}
-                            actor_counts[aid]['count'] += 1
-
-print(f'Total itens: {total}')
-print(f'Com cast: {items_with_cast}')
-
-# Top 10 atores
-top = sorted(actor_counts.items(), key=lambda x: x[1]['count'], reverse=True)[:10]
-print('\nTop 10 atores:')
-for aid, info in top:
-    print(f"  {info['name']} (ID: {aid}): {info['count']} aparicoes")
+try:
+    import ijson  # Parser em streaming (backend yajl2_c quando instalado)
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def read_json(path):
+    # orjson lê direto do arquivo mapeado, sem copiá-lo para um bytes
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def iter_items(path):
+    # Com ijson os itens são lidos um a um, sem materializar o arquivo inteiro
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    else:
+        yield from read_json(path)
+
+def scan(path):
+    """Retorna (total, itens com cast, contagem por ator, nome por ator) de um arquivo."""
+    total = 0
+    items_with_cast = 0
+    counts = Counter()
+    names = {}
+    for item in iter_items(path):
+        if item is None:
+            continue
+        total += 1
+        tmdb = item.get('tmdb', {})
+        if tmdb:
+            cast = tmdb.get('cast', [])
+            if cast:
+                items_with_cast += 1
+                for actor in cast:
+                    aid = actor.get('id', 0)
+                    counts[aid] += 1
+                    if aid not in names:
+                        names[aid] = actor.get('name', '')
+    return total, items_with_cast, counts, names
+
+if __name__ == '__main__':
+    enriched_dir = 'json/enriched'
+    paths = [os.path.join(enriched_dir, file) for file in os.listdir(enriched_dir) if file.endswith('.json')]
+
+    # Cada arquivo é independente: processa em paralelo e junta os resultados
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(scan, paths, chunksize=4))
+
+    total = sum(r[0] for r in results)
+    items_with_cast = sum(r[1] for r in results)
+    actor_counts = Counter()
+    actor_names = {}
+    for _, _, counts, names in results:
+        actor_counts.update(counts)
+        for aid, name in names.items():
+            actor_names.setdefault(aid, name)
+
+    print(f'Total itens: {total}')
+    print(f'Com cast: {items_with_cast}')
+
+    # Top 10 atores
+    print('\nTop 10 atores:')
+    for aid, count in actor_counts.most_common(10):
+        print(f"  {actor_names[aid]} (ID: {aid}): {count} aparicoes")
@@ -5,37 +5,72 @@ O nome da categoria é extraído diretamente do campo 'category' do primeiro ite
 """
 import os
 import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Parser/encoder em C, bem mais rápido que o json da stdlib
+except ImportError:
+    orjson = None
+
+def read_json(filepath):
+    # orjson lê direto do arquivo mapeado, sem copiá-lo para um bytes
+    with open(filepath, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def summarize(filepath):
+    """Retorna (quantidade de itens, primeiro item) de um JSON de array; (0, None) se não for array."""
+    data = read_json(filepath)
+    if not isinstance(data, list):
+        return 0, None
+    return len(data), data[0] if data else None
+
+def process(entry):
+    """Retorna (categoria, None) ou (None, mensagem de erro) para um arquivo enriched."""
+    try:
+        count, first = summarize(entry.path)
+        file_id = entry.name[:-5]  # Remove ".json" (filtrado no scandir)
+        is_adult = "adulto" in file_id.lower()
+        
+        # Extrai o nome da categoria do primeiro item do JSON
+        if count > 0 and "category" in first:
+            name = first["category"]
+        else:
+            name = file_id.replace("-", " ").title()
+        
+        return {
+            "name": name,
+            "file": entry.name,
+            "count": count,
+            "isAdult": is_adult
+        }, None
+    except Exception as e:
+        return None, f"Erro em {entry.name}: {e}"
 
 enriched_path = "json/enriched"
 categories = []
 
-for filename in sorted(os.listdir(enriched_path)):
-    if filename.endswith(".json"):
-        filepath = os.path.join(enriched_path, filename)
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            count = len(data) if isinstance(data, list) else 0
-            file_id = filename.replace(".json", "")
-            is_adult = "adulto" in file_id.lower()
-            
-            # Extrai o nome da categoria do primeiro item do JSON
-            if isinstance(data, list) and len(data) > 0 and "category" in data[0]:
-                name = data[0]["category"]
-            else:
-                name = file_id.replace("-", " ").title()
-            
-            categories.append({
-                "name": name,
-                "file": filename,
-                "count": count,
-                "isAdult": is_adult
-            })
-        except Exception as e:
-            print(f"Erro em {filename}: {e}")
-
-with open("json/categories.json", "w", encoding="utf-8") as f:
-    json.dump(categories, f, indent=2, ensure_ascii=False)
+# Ordena antes de despachar: ex.map devolve na ordem de submissão
+with os.scandir(enriched_path) as it:
+    entries = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
+
+# Leitura/parse de cada arquivo é independente: processa em paralelo
+with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+    for category, error in ex.map(process, entries):
+        if error:
+            print(error)
+        else:
+            categories.append(category)
+
+if orjson is not None:
+    with open("json/categories.json", "wb") as f:
+        f.write(orjson.dumps(categories, option=orjson.OPT_INDENT_2))
+else:
+    with open("json/categories.json", "w", encoding="utf-8") as f:
+        json.dump(categories, f, indent=2, ensure_ascii=False)
 
 total = sum(c["count"] for c in categories)
 print(f"✅ Criado json/categories.json com {len(categories)} categorias")